@@ -24,21 +24,17 @@ def chain(fixation_XY, text_block, x_thresh=192, y_thresh=32):
     except ModuleNotFoundError as e:
         e.msg = "The chain method requires NumPy."
         raise
-    fixation_XY = np.array(fixation_XY, dtype=int)
+    fixation_XY = np.asarray(fixation_XY, dtype=int)
     line_Y = np.array(text_block.midlines, dtype=int)
     dist_X = abs(np.diff(fixation_XY[:, 0]))
     dist_Y = abs(np.diff(fixation_XY[:, 1]))
-    end_chain_indices = list(
-        np.where(np.logical_or(dist_X > x_thresh, dist_Y > y_thresh))[0] + 1
+    chain_starts = np.append(
+        0, np.where(np.logical_or(dist_X > x_thresh, dist_Y > y_thresh))[0] + 1
     )
-    end_chain_indices.append(len(fixation_XY))
-    start_of_chain = 0
-    for end_of_chain in end_chain_indices:
-        mean_y = np.mean(fixation_XY[start_of_chain:end_of_chain, 1])
-        line_i = np.argmin(abs(line_Y - mean_y))
-        fixation_XY[start_of_chain:end_of_chain, 1] = line_Y[line_i]
-        start_of_chain = end_of_chain
-    return fixation_XY[:, 1]
+    chain_lengths = np.diff(np.append(chain_starts, len(fixation_XY)))
+    mean_Y = np.add.reduceat(fixation_XY[:, 1], chain_starts) / chain_lengths
+    line_indices = abs(line_Y[None, :] - mean_Y[:, None]).argmin(axis=1)
+    return np.repeat(line_Y[line_indices], chain_lengths)
 
 
 ######################################################################
@@ -51,18 +47,34 @@ def chain(fixation_XY, text_block, x_thresh=192, y_thresh=32):
 def cluster(fixation_XY, text_block):
     """
     Classify fixations into *m* clusters based on their Y-values, and then
-    assign clusters to text lines in positional order. Requires SciPy.
+    assign clusters to text lines in positional order. Requires NumPy.
     Original method implemented in [popEye](https://github.com/sascha2schroeder/popEye/).
     """
     try:
         import numpy as np
-        from scipy.cluster.vq import kmeans2
     except ModuleNotFoundError as e:
-        e.msg = "The cluster method requires SciPy."
+        e.msg = "The cluster method requires NumPy."
         raise
-    fixation_Y = np.array(fixation_XY, dtype=float)[:, 1]
+    fixation_Y = np.asarray(fixation_XY, dtype=float)[:, 1]
     line_Y = np.array(text_block.midlines, dtype=int)
-    _, clusters = kmeans2(fixation_Y, line_Y, iter=100, minit="matrix", missing="warn")
+    # 1-D k-means (Lloyd's algorithm) seeded with the line positions; an
+    # empty cluster keeps its previous center
+    centers = line_Y.astype(float)
+    for _ in range(100):
+        clusters = abs(fixation_Y[:, None] - centers[None, :]).argmin(axis=1)
+        counts = np.bincount(clusters, minlength=len(centers))
+        sums = np.bincount(clusters, weights=fixation_Y, minlength=len(centers))
+        new_centers = np.where(counts > 0, sums / np.maximum(counts, 1), centers)
+        if np.array_equal(new_centers, centers):
+            break
+        centers = new_centers
+    if not counts.all():
+        import warnings as _warnings
+
+        _warnings.warn(
+            "The cluster method found at least one line with no fixations assigned to it."
+        )
+    clusters = abs(fixation_Y[:, None] - centers[None, :]).argmin(axis=1)
     return line_Y[clusters]
 
 
@@ -93,7 +105,7 @@ def merge(fixation_XY, text_block, y_thresh=32, gradient_thresh=0.1, error_thres
     except ModuleNotFoundError as e:
         e.msg = "The merge method requires NumPy."
         raise
-    fixation_XY = np.array(fixation_XY, dtype=int)
+    fixation_XY = np.asarray(fixation_XY, dtype=int)
     line_Y = np.array(text_block.midlines, dtype=int)
     diff_X = np.diff(fixation_XY[:, 0])
     dist_Y = abs(np.diff(fixation_XY[:, 1]))
@@ -110,6 +122,21 @@ def merge(fixation_XY, text_block, y_thresh=32, gradient_thresh=0.1, error_thres
     sequences = [
         list(range(start, end)) for start, end in zip(sequence_starts, sequence_ends)
     ]
+
+    def fit_line(candidate_XY):
+        # Closed-form least-squares line fit, returning the gradient and the
+        # root-mean-square error of the residuals
+        dX = candidate_XY[:, 0] - candidate_XY[:, 0].mean()
+        dY = candidate_XY[:, 1] - candidate_XY[:, 1].mean()
+        ss_X = (dX * dX).sum()
+        if ss_X == 0:  # all x-values are equal, fall back to the lstsq solution
+            gradient, intercept = np.polyfit(candidate_XY[:, 0], candidate_XY[:, 1], 1)
+            residuals = candidate_XY[:, 1] - (gradient * candidate_XY[:, 0] + intercept)
+        else:
+            gradient = (dX * dY).sum() / ss_X
+            residuals = dY - gradient * dX
+        return gradient, np.sqrt((residuals * residuals).mean())
+
     for min_i, min_j, remove_constraints in [
         (3, 3, False),  # Phase 1
         (1, 3, False),  # Phase 2
@@ -125,14 +152,7 @@ def merge(fixation_XY, text_block, y_thresh=32, gradient_thresh=0.1, error_thres
                 for j in range(i + 1, len(sequences)):
                     if len(sequences[j]) < min_j:
                         continue  # second sequence too short, skip to next j
-                    candidate_XY = fixation_XY[sequences[i] + sequences[j]]
-                    gradient, intercept = np.polyfit(
-                        candidate_XY[:, 0], candidate_XY[:, 1], 1
-                    )
-                    residuals = candidate_XY[:, 1] - (
-                        gradient * candidate_XY[:, 0] + intercept
-                    )
-                    error = np.sqrt(sum(residuals**2) / len(candidate_XY))
+                    gradient, error = fit_line(fixation_XY[sequences[i] + sequences[j]])
                     if remove_constraints or (
                         abs(gradient) < gradient_thresh and error < error_thresh
                     ):
@@ -145,11 +165,15 @@ def merge(fixation_XY, text_block, y_thresh=32, gradient_thresh=0.1, error_thres
             merged_sequence = sequences[merge_i] + sequences[merge_j]
             sequences.append(merged_sequence)
             del sequences[merge_j], sequences[merge_i]
-    mean_Y = [fixation_XY[sequence, 1].mean() for sequence in sequences]
-    ordered_sequence_indices = np.argsort(mean_Y)
-    for line_i, sequence_i in enumerate(ordered_sequence_indices):
-        fixation_XY[sequences[sequence_i], 1] = line_Y[line_i]
-    return fixation_XY[:, 1]
+    sequence_labels = np.zeros(len(fixation_XY), dtype=int)
+    for sequence_i, sequence in enumerate(sequences):
+        sequence_labels[sequence] = sequence_i
+    mean_Y = np.bincount(sequence_labels, weights=fixation_XY[:, 1]) / np.bincount(
+        sequence_labels
+    )
+    # Rank the sequences by mean y-value and map the nth sequence to the nth line
+    sequence_ranks = np.argsort(np.argsort(mean_Y))
+    return line_Y[sequence_ranks[sequence_labels]]
 
 
 ######################################################################
@@ -178,33 +202,47 @@ def regress(
     `offset_bounds=(-50, 50)`, `std_bounds=(1, 20)`. Requires SciPy.
     Original method by [Cohen (2013)](https://doi.org/10.3758/s13428-012-0280-3).
     """
+    from math import erf, log, pi, sqrt
+
     try:
         import numpy as np
         from scipy.optimize import minimize
-        from scipy.stats import norm
     except ModuleNotFoundError as e:
         e.msg = "The regress method requires SciPy."
         raise
-    fixation_XY = np.array(fixation_XY, dtype=int)
+    fixation_XY = np.asarray(fixation_XY, dtype=int)
     line_Y = np.array(text_block.midlines, dtype=int)
-    density = np.zeros((len(fixation_XY), len(line_Y)))
+    # Powell calls fit_lines many times, so the fixation columns and the
+    # (n_fixations, n_lines) work buffer are set up once and reused
+    fixation_X = fixation_XY[:, 0, None].astype(float)
+    fixation_Y = fixation_XY[:, 1, None].astype(float)
+    residual = np.zeros((len(fixation_XY), len(line_Y)))
+
+    log_sqrt_2pi = 0.5 * log(2 * pi)
+
+    def norm_cdf(x):
+        # Standard normal CDF of a scalar, avoiding scipy.stats dispatch
+        return 0.5 * (1 + erf(x / sqrt(2)))
 
     def fit_lines(params):
-        k = slope_bounds[0] + (slope_bounds[1] - slope_bounds[0]) * norm.cdf(params[0])
-        o = offset_bounds[0] + (offset_bounds[1] - offset_bounds[0]) * norm.cdf(
+        k = slope_bounds[0] + (slope_bounds[1] - slope_bounds[0]) * norm_cdf(params[0])
+        o = offset_bounds[0] + (offset_bounds[1] - offset_bounds[0]) * norm_cdf(
             params[1]
         )
-        s = std_bounds[0] + (std_bounds[1] - std_bounds[0]) * norm.cdf(params[2])
-        predicted_Y_from_slope = fixation_XY[:, 0] * k
-        line_Y_plus_offset = line_Y + o
-        for line_i in range(len(line_Y)):
-            fit_Y = predicted_Y_from_slope + line_Y_plus_offset[line_i]
-            density[:, line_i] = norm.logpdf(fixation_XY[:, 1], fit_Y, s)
-        return -sum(density.max(axis=1))
+        s = std_bounds[0] + (std_bounds[1] - std_bounds[0]) * norm_cdf(params[2])
+        # The Gaussian log density decreases with the absolute residual, so
+        # each fixation's best line is the one with the smallest residual,
+        # and the density only needs evaluating for that one
+        np.multiply(fixation_X, k, out=residual)
+        np.add(residual, line_Y + o, out=residual)
+        np.subtract(fixation_Y, residual, out=residual)
+        np.abs(residual, out=residual)
+        z = residual.min(axis=1) / s
+        return -(-0.5 * z**2 - log(s) - log_sqrt_2pi).sum()
 
     best_fit = minimize(fit_lines, [0, 0, 0], method="powell")
     fit_lines(best_fit.x)
-    return line_Y[density.argmax(axis=1)]
+    return line_Y[residual.argmin(axis=1)]
 
 
 ######################################################################
@@ -231,20 +269,22 @@ def segment(fixation_XY, text_block):
     except ModuleNotFoundError as e:
         e.msg = "The segment method requires NumPy."
         raise
-    fixation_XY = np.array(fixation_XY, dtype=int)
+    fixation_XY = np.asarray(fixation_XY, dtype=int)
     line_Y = np.array(text_block.midlines, dtype=int)
     diff_X = np.diff(fixation_XY[:, 0])
-    saccades_ordered_by_length = np.argsort(diff_X)
-    if text_block.right_to_left:
-        line_change_indices = saccades_ordered_by_length[-(len(line_Y) - 1) :]
+    n_changes = min(len(line_Y) - 1, len(diff_X))
+    # Only the m-1 longest saccades are needed, so partition rather than sort
+    if n_changes == 0:
+        line_change_indices = np.array([], dtype=int)
+    elif text_block.right_to_left:
+        line_change_indices = np.argpartition(diff_X, -n_changes)[-n_changes:]
     else:
-        line_change_indices = saccades_ordered_by_length[: len(line_Y) - 1]
-    current_line_i = 0
-    for fixation_i in range(len(fixation_XY)):
-        fixation_XY[fixation_i, 1] = line_Y[current_line_i]
-        if fixation_i in line_change_indices:
-            current_line_i += 1
-    return fixation_XY[:, 1]
+        line_change_indices = np.argpartition(diff_X, n_changes - 1)[:n_changes]
+    # Each fixation's line is the number of line changes that precede it
+    line_indices = np.searchsorted(
+        np.sort(line_change_indices), np.arange(len(fixation_XY))
+    )
+    return line_Y[line_indices]
 
 
 ######################################################################
@@ -271,9 +311,18 @@ def slice(fixation_XY, text_block, x_thresh=192, y_thresh=32, w_thresh=32, n_thr
     except ModuleNotFoundError as e:
         e.msg = "The slice method requires NumPy."
         raise
-    fixation_XY = np.array(fixation_XY, dtype=int)
+    fixation_XY = np.asarray(fixation_XY, dtype=int)
     line_Y = np.array(text_block.midlines, dtype=int)
+    corrected_Y = np.zeros(len(fixation_XY), dtype=int)
     proto_lines, phantom_proto_lines = {}, {}
+
+    def mean_y_difference(run, proto_line_XY):
+        # Mean y-difference between each fixation in the run and the
+        # x-nearest point on the proto line, found for all fixations at once
+        run_XY = fixation_XY[run]
+        nearest = abs(proto_line_XY[None, :, 0] - run_XY[:, 0, None]).argmin(axis=1)
+        return np.mean(run_XY[:, 1] - proto_line_XY[nearest, 1])
+
     # 1. Segment runs
     dist_X = abs(np.diff(fixation_XY[:, 0]))
     dist_Y = abs(np.diff(fixation_XY[:, 1]))
@@ -300,13 +349,9 @@ def slice(fixation_XY, text_block, x_thresh=192, y_thresh=32, w_thresh=32, n_thr
             else:
                 proto_line_XY = phantom_proto_lines[proto_line_i]
             # Compute differences between current proto line and all runs
-            run_differences = np.zeros(len(runs))
-            for run_i, run in enumerate(runs):
-                y_diffs = [
-                    y - proto_line_XY[np.argmin(abs(proto_line_XY[:, 0] - x)), 1]
-                    for x, y in fixation_XY[run]
-                ]
-                run_differences[run_i] = np.mean(y_diffs)
+            run_differences = np.array(
+                [mean_y_difference(run, proto_line_XY) for run in runs]
+            )
             # Find runs that can be merged into this proto line
             merge_into_current = list(np.where(abs(run_differences) < w_thresh)[0])
             # Find runs that can be merged into the adjacent proto line
@@ -346,11 +391,7 @@ def slice(fixation_XY, text_block, x_thresh=192, y_thresh=32, w_thresh=32, n_thr
                 proto_line_XY = fixation_XY[proto_lines[proto_line_i]]
             else:
                 proto_line_XY = phantom_proto_lines[proto_line_i]
-            y_diffs = [
-                y - proto_line_XY[np.argmin(abs(proto_line_XY[:, 0] - x)), 1]
-                for x, y in fixation_XY[run]
-            ]
-            pl_distance = abs(np.mean(y_diffs))
+            pl_distance = abs(mean_y_difference(run, proto_line_XY))
             if pl_distance < best_pl_distance:
                 best_pl_distance = pl_distance
                 best_pl_assignemnt = proto_line_i
@@ -366,8 +407,8 @@ def slice(fixation_XY, text_block, x_thresh=192, y_thresh=32, w_thresh=32, n_thr
             del proto_lines[bot]
     # 6. Map proto lines to text lines
     for line_i, proto_line_i in enumerate(sorted(proto_lines)):
-        fixation_XY[proto_lines[proto_line_i], 1] = line_Y[line_i]
-    return fixation_XY[:, 1]
+        corrected_Y[proto_lines[proto_line_i]] = line_Y[line_i]
+    return corrected_Y
 
 
 ######################################################################
@@ -394,7 +435,7 @@ def split(fixation_XY, text_block):
     except ModuleNotFoundError as e:
         e.msg = "The split method requires SciPy."
         raise
-    fixation_XY = np.array(fixation_XY, dtype=int)
+    fixation_XY = np.asarray(fixation_XY, dtype=int)
     line_Y = np.array(text_block.midlines, dtype=int)
     diff_X = np.array(np.diff(fixation_XY[:, 0]), dtype=float).reshape(-1, 1)
     centers, clusters = kmeans2(diff_X, 2, iter=100, minit="++", missing="raise")
@@ -402,15 +443,11 @@ def split(fixation_XY, text_block):
         sweep_marker = np.argmax(centers)
     else:
         sweep_marker = np.argmin(centers)
-    end_line_indices = list(np.where(clusters == sweep_marker)[0] + 1)
-    end_line_indices.append(len(fixation_XY))
-    start_of_line = 0
-    for end_of_line in end_line_indices:
-        mean_y = np.mean(fixation_XY[start_of_line:end_of_line, 1])
-        line_i = np.argmin(abs(line_Y - mean_y))
-        fixation_XY[start_of_line:end_of_line] = line_Y[line_i]
-        start_of_line = end_of_line
-    return fixation_XY[:, 1]
+    line_starts = np.append(0, np.where(clusters == sweep_marker)[0] + 1)
+    line_lengths = np.diff(np.append(line_starts, len(fixation_XY)))
+    mean_Y = np.add.reduceat(fixation_XY[:, 1], line_starts) / line_lengths
+    line_indices = abs(line_Y[None, :] - mean_Y[:, None]).argmin(axis=1)
+    return np.repeat(line_Y[line_indices], line_lengths)
 
 
 ######################################################################
@@ -440,16 +477,16 @@ def stretch(
     except ModuleNotFoundError as e:
         e.msg = "The stretch method requires SciPy."
         raise
-    fixation_Y = np.array(fixation_XY, dtype=int)[:, 1]
+    fixation_Y = np.asarray(fixation_XY, dtype=int)[:, 1]
     line_Y = np.array(text_block.midlines, dtype=int)
     n = len(fixation_Y)
     corrected_Y = np.zeros(n)
 
     def fit_lines(params):
         candidate_Y = fixation_Y * params[0] + params[1]
-        for fixation_i in range(n):
-            line_i = np.argmin(abs(line_Y - candidate_Y[fixation_i]))
-            corrected_Y[fixation_i] = line_Y[line_i]
+        # Nearest line for every fixation in one broadcast
+        line_indices = abs(line_Y[None, :] - candidate_Y[:, None]).argmin(axis=1)
+        corrected_Y[:] = line_Y[line_indices]
         return sum(abs(candidate_Y - corrected_Y))
 
     best_fit = minimize(
@@ -485,39 +522,54 @@ def warp(fixation_XY, text_block):
     order. Requires NumPy.
     Original method by [Carr et al. (2022)](https://doi.org/10.3758/s13428-021-01554-0).
     """
+    from collections import Counter
+
     try:
         import numpy as np
     except ModuleNotFoundError as e:
         e.msg = "The warp method requires NumPy."
         raise
-    fixation_XY = np.array(fixation_XY, dtype=int)
+    fixation_XY = np.asarray(fixation_XY, dtype=int)
     word_XY = np.array([word.center for word in text_block.words()], dtype=int)
+    corrected_Y = np.zeros(len(fixation_XY), dtype=int)
     n1 = len(fixation_XY)
     n2 = len(word_XY)
     cost = np.zeros((n1 + 1, n2 + 1))
     cost[0, :] = np.inf
     cost[:, 0] = np.inf
     cost[0, 0] = 0
-    for fixation_i in range(n1):
-        for word_i in range(n2):
-            distance = np.sqrt(sum((fixation_XY[fixation_i] - word_XY[word_i]) ** 2))
-            cost[fixation_i + 1, word_i + 1] = distance + min(
-                cost[fixation_i, word_i + 1],
-                cost[fixation_i + 1, word_i],
-                cost[fixation_i, word_i],
-            )
-    cost = cost[1:, 1:]
+    # Start from the fixation-word distances, computed in one broadcast
+    diff_X = fixation_XY[:, 0, None] - word_XY[None, :, 0]
+    diff_Y = fixation_XY[:, 1, None] - word_XY[None, :, 1]
+    cost[1:, 1:] = np.sqrt(diff_X * diff_X + diff_Y * diff_Y)
+    # Each cell depends only on its upper, left, and upper-left neighbors,
+    # so all cells on an anti-diagonal can be filled at once. The cheapest
+    # move into each cell is recorded for the traceback, preferring
+    # diagonal, then upward on ties (0 = diagonal, 1 = upward, 2 = leftward)
+    move = np.zeros((n1 + 1, n2 + 1), dtype=np.int8)
+    flat_cost = cost.ravel()
+    flat_move = move.ravel()
+    row_length = n2 + 1
+    for diagonal in range(2, n1 + n2 + 1):
+        fixation_indices = np.arange(max(1, diagonal - n2), min(n1, diagonal - 1) + 1)
+        cells = fixation_indices * row_length + (diagonal - fixation_indices)
+        upward_cost = flat_cost[cells - row_length]
+        leftward_cost = flat_cost[cells - 1]
+        diagonal_cost = flat_cost[cells - row_length - 1]
+        flat_cost[cells] += np.minimum(
+            np.minimum(upward_cost, leftward_cost), diagonal_cost
+        )
+        flat_move[cells] = np.where(
+            (diagonal_cost <= upward_cost) & (diagonal_cost <= leftward_cost),
+            0,
+            np.where(upward_cost <= leftward_cost, 1, 2),
+        )
+    move = move[1:, 1:]
+    fixation_i, word_i = n1 - 1, n2 - 1
     warping_path = [[] for _ in range(n1)]
     while fixation_i > 0 or word_i > 0:
         warping_path[fixation_i].append(word_i)
-        possible_moves = [np.inf, np.inf, np.inf]
-        if fixation_i > 0 and word_i > 0:
-            possible_moves[0] = cost[fixation_i - 1, word_i - 1]
-        if fixation_i > 0:
-            possible_moves[1] = cost[fixation_i - 1, word_i]
-        if word_i > 0:
-            possible_moves[2] = cost[fixation_i, word_i - 1]
-        best_move = np.argmin(possible_moves)
+        best_move = move[fixation_i, word_i]
         if best_move == 0:
             fixation_i -= 1
             word_i -= 1
@@ -526,10 +578,15 @@ def warp(fixation_XY, text_block):
         else:
             word_i -= 1
     warping_path[0].append(0)
+    # Word y-values as a plain list, so the mode step indexes Python ints
+    # instead of fancy-indexing the array once per fixation
+    word_Y = word_XY[:, 1].tolist()
     for fixation_i, words_mapped_to_fixation_i in enumerate(warping_path):
-        candidate_Y = list(word_XY[words_mapped_to_fixation_i, 1])
-        fixation_XY[fixation_i, 1] = max(set(candidate_Y), key=candidate_Y.count)
-    return fixation_XY[:, 1]
+        candidate_Y = [word_Y[word_i] for word_i in words_mapped_to_fixation_i]
+        # Modal y-value; counted once rather than rescanning per unique value
+        candidate_counts = Counter(candidate_Y)
+        corrected_Y[fixation_i] = max(set(candidate_Y), key=candidate_counts.get)
+    return corrected_Y
 
 
 methods = {
@@ -553,36 +610,33 @@ def wisdom_of_the_crowd(assignments):
     """
     import numpy as np
 
-    def fleiss_kappa(assignments):
+    def fleiss_kappa(ratings):
         """
-        Calculate Fleiss's kappa on a set of line assignments.
+        Calculate Fleiss's kappa on a table of line assignments, where
+        ratings[i, j] is the number of methods that assigned fixation i to
+        category j.
         https://en.wikipedia.org/wiki/Fleiss%27_kappa
         """
-        n_fixations, n_methods = assignments.shape
-        categories = list(np.unique(assignments))
-        ratings = np.zeros((n_fixations, len(categories)), dtype=int)
-        for i, row in enumerate(assignments):
-            for val in row:
-                ratings[i, categories.index(val)] += 1
+        n_fixations = len(ratings)
+        n_methods = ratings[0].sum()
         p_bar = (
-            sum(((ratings**2).sum(axis=1) - n_methods) / (n_methods * (n_methods - 1)))
-            / n_fixations
-        )
-        p_bar_e = sum((ratings.sum(axis=0) / (n_fixations * n_methods)) ** 2)
+            ((ratings**2).sum(axis=1) - n_methods) / (n_methods * (n_methods - 1))
+        ).sum() / n_fixations
+        p_bar_e = ((ratings.sum(axis=0) / (n_fixations * n_methods)) ** 2).sum()
         return (p_bar - p_bar_e) / (1 - p_bar_e)
 
     assignments = np.column_stack(assignments)
-    correction = []
-    for row in assignments:
-        candidates = list(row)
-        candidate_counts = {y: candidates.count(y) for y in set(candidates)}
-        best_count = max(candidate_counts.values())
-        best_candidates = [y for y, c in candidate_counts.items() if c == best_count]
-        if len(best_candidates) == 1:
-            correction.append(best_candidates[0])
-        else:
-            for y in row:
-                if y in best_candidates:
-                    correction.append(y)
-                    break
-    return correction, fleiss_kappa(assignments)
+    n_fixations, n_methods = assignments.shape
+    fixation_indices = np.arange(n_fixations)
+    # Count the votes for each candidate y-value on each fixation
+    categories, category_indices = np.unique(assignments, return_inverse=True)
+    category_indices = category_indices.reshape(n_fixations, n_methods)
+    votes = np.bincount(
+        (fixation_indices[:, None] * len(categories) + category_indices).ravel(),
+        minlength=n_fixations * len(categories),
+    ).reshape(n_fixations, len(categories))
+    # For each fixation, find the left-most method whose y-value has the most votes
+    method_votes = votes[fixation_indices[:, None], category_indices]
+    winning_methods = (method_votes == method_votes.max(axis=1)[:, None]).argmax(axis=1)
+    correction = assignments[fixation_indices, winning_methods]
+    return correction, fleiss_kappa(votes)
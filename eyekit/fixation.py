@@ -513,7 +513,7 @@ class FixationSequence:
                 raise ValueError(
                     f"Invalid method. Supported methods are: {', '.join(_snap.methods)}"
                 )
-            fixation_XY = [fixation.xy for fixation in self.iter_without_discards()]
+            fixation_XY = self._fixation_XY()
             corrected_Y = _snap.methods[method](fixation_XY, text_block, **kwargs)
 
         # TRY MANY METHODS AND USE WISDOM OF THE CROWD
@@ -523,6 +523,14 @@ class FixationSequence:
                 raise ValueError(
                     f"You must choose at least three methods. Supported methods are: {', '.join(_snap.methods)}"
                 )
+            try:
+                import numpy as np
+            except ModuleNotFoundError as e:
+                e.msg = "Applying multiple methods requires NumPy."
+                raise
+            # Convert the fixations to an array once; the methods do not
+            # modify their input, so they can all share this one array
+            fixation_XY = np.array(self._fixation_XY(), dtype=int)
             corrections = []
             for method in methods:
                 if isinstance(method, tuple):
@@ -533,7 +541,6 @@ class FixationSequence:
                     raise ValueError(
                         f"Invalid method. Supported methods are: {', '.join(_snap.methods)}"
                     )
-                fixation_XY = [fixation.xy for fixation in self.iter_without_discards()]
                 corrections.append(
                     _snap.methods[method](fixation_XY, text_block, **kwargs)
                 )
@@ -548,6 +555,28 @@ class FixationSequence:
 
         return delta / n_fixations, kappa
 
+    def _fixation_XY(self):
+        """
+        Return the XY-coordinates of the non-discarded fixations as a list of
+        tuples. The fields are read directly, rather than through the
+        generator and properties, since this is the input to every snapping
+        method.
+        """
+        return [
+            (fixation._x, fixation._y)
+            for fixation in self._sequence
+            if not fixation._discarded
+        ]
+
+    def _iter_fixation_XY(self):
+        """
+        Iterate over the non-discarded fixations, yielding each fixation along
+        with its x- and y-coordinates.
+        """
+        for fixation in self._sequence:
+            if not fixation._discarded:
+                yield fixation, fixation._x, fixation._y
+
     def serialize(self) -> list:
         """
         Returns representation of the fixation sequence in simple list format
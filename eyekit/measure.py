@@ -5,7 +5,7 @@ initial landing position.
 
 from functools import wraps as _wraps
 from .fixation import _is_FixationSequence
-from .text import _is_InterestArea, _is_TextBlock, _fail, InterestArea as _InterestArea
+from .text import _is_TextBlock, _fail, InterestArea as _InterestArea
 
 
 def _handle_collections(func):
@@ -22,18 +22,42 @@ def _handle_collections(func):
     @_wraps(func)
     def func_wrapper(interest_area, fixation_sequence):
         _is_FixationSequence(fixation_sequence)
+        if isinstance(interest_area, _InterestArea):
+            return func(interest_area, fixation_sequence)
         try:
-            _is_InterestArea(interest_area)
-        except TypeError:
-            try:
-                return {ia.id: func(ia, fixation_sequence) for ia in interest_area}
-            except Exception:
-                _fail(interest_area, "InterestArea or an iterable")
-        return func(interest_area, fixation_sequence)
+            return {ia.id: func(ia, fixation_sequence) for ia in interest_area}
+        except Exception:
+            _fail(interest_area, "InterestArea or an iterable")
 
     return func_wrapper
 
 
+def _fixation_hits(interest_area, fixation_sequence):
+    """
+    Iterate over the fixation sequence (without discards), yielding each
+    fixation along with whether it falls inside the interest area.
+    """
+    x_tl, y_tl = interest_area.x_tl, interest_area.y_tl
+    x_br, y_br = interest_area.x_br, interest_area.y_br
+    for fixation, x, y in fixation_sequence._iter_fixation_XY():
+        yield fixation, (x_tl <= x <= x_br and y_tl <= y <= y_br)
+
+
+def _initial_landing(interest_area, fixation_sequence):
+    """
+    Find the first fixation to land on a character of the interest area (not
+    just in its padding) and return the character position (counting from 1)
+    along with the fixation, or `(None, None)` if there is no such fixation.
+    Shared by `initial_landing_position()` and `initial_landing_distance()`.
+    """
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
+            for position, char in enumerate(interest_area, 1):
+                if fixation in char:
+                    return position, fixation
+    return None, None
+
+
 def interest_area_report(trials, measures):
     """
     Given one or more trials and one or more measures, apply each measure to
@@ -130,8 +154,8 @@ def number_of_fixations(interest_area, fixation_sequence):
     fixations on that interest area.
     """
     count = 0
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
             count += 1
     return count
 
@@ -142,8 +166,8 @@ def initial_fixation_duration(interest_area, fixation_sequence):
     Given an interest area and fixation sequence, return the duration of the
     initial fixation on that interest area.
     """
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
             return fixation.duration
     return 0
 
@@ -156,8 +180,8 @@ def first_of_many_duration(interest_area, fixation_sequence):
     one fixation on the interest area (otherwise return `None`).
     """
     duration = None
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
             if duration is not None:
                 return duration
             duration = fixation.duration
@@ -171,8 +195,8 @@ def total_fixation_duration(interest_area, fixation_sequence):
     all fixations on that interest area.
     """
     duration = 0
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
             duration += fixation.duration
     return duration
 
@@ -185,8 +209,8 @@ def gaze_duration(interest_area, fixation_sequence):
     inside an interest area until the area is exited for the first time.
     """
     duration = 0
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
             duration += fixation.duration
         elif duration > 0:
             break  # at least one previous fixation was inside the IA and this fixation is not, so break
@@ -204,8 +228,8 @@ def go_past_duration(interest_area, fixation_sequence):
     """
     duration = 0
     entered = False
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
             entered = True
             duration += fixation.duration
         elif entered:
@@ -226,8 +250,8 @@ def second_pass_duration(interest_area, fixation_sequence):
     duration = 0
     current_pass = None
     next_pass = 1
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
             if current_pass is None:  # first fixation in a new pass
                 current_pass = next_pass
             if current_pass == 2:
@@ -249,12 +273,8 @@ def initial_landing_position(interest_area, fixation_sequence):
     the first character is the rightmost one. Returns `None` if no fixation
     landed on the interest area.
     """
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
-            for position, char in enumerate(interest_area, 1):
-                if fixation in char:
-                    return position
-    return None
+    position, _ = _initial_landing(interest_area, fixation_sequence)
+    return position
 
 
 @_handle_collections
@@ -268,12 +288,10 @@ def initial_landing_distance(interest_area, fixation_sequence):
     without including any padding. Returns `None` if no fixation landed on the
     interest area.
     """
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
-            for char in interest_area:
-                if fixation in char:  # be sure not to find a fixation in the padding
-                    return abs(interest_area.onset - fixation.x)
-    return None
+    _, fixation = _initial_landing(interest_area, fixation_sequence)
+    if fixation is None:
+        return None
+    return abs(interest_area.onset - fixation.x)
 
 
 @_handle_collections
@@ -290,8 +308,8 @@ def landing_distances(interest_area, fixation_sequence):
 
     _warnings.warn("eyekit.measure.landing_distances() is deprecated", FutureWarning)
     distances = []
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if inside:
             for char in interest_area:
                 if fixation in char:  # be sure not to find a fixation in the padding
                     distances.append(abs(interest_area.onset - fixation.x))
@@ -308,27 +326,25 @@ def number_of_regressions_in(interest_area, fixation_sequence):
     interest area from the right (or from the left in the case of
     right-to-left text).
     """
+    right_to_left = interest_area.right_to_left
     entered_interest_area = False
-    first_exit_index = None
-    for fixation in fixation_sequence.iter_without_discards():
-        if fixation in interest_area:
+    exited_interest_area = False
+    prev_x = prev_inside = None
+    count = 0
+    for fixation, inside in _fixation_hits(interest_area, fixation_sequence):
+        if exited_interest_area:
+            if inside and not prev_inside:  # reentered from the previous fixation
+                if right_to_left:
+                    if fixation.x > prev_x:
+                        count += 1
+                else:
+                    if fixation.x < prev_x:
+                        count += 1
+        elif inside:
             entered_interest_area = True
         elif entered_interest_area:
-            first_exit_index = fixation.index
-            break
-    if first_exit_index is None:
-        return 0  # IA was never exited, so there can't be any regressions back to it
-    count = 0
-    for prev_fix, curr_fix in fixation_sequence.iter_pairs(include_discards=False):
-        if prev_fix.index < first_exit_index:
-            continue
-        if prev_fix not in interest_area and curr_fix in interest_area:
-            if interest_area.right_to_left:
-                if curr_fix.x > prev_fix.x:
-                    count += 1
-            else:
-                if curr_fix.x < prev_fix.x:
-                    count += 1
+            exited_interest_area = True  # first fixation to exit the IA
+        prev_x, prev_inside = fixation.x, inside
     return count
 
 
@@ -356,7 +372,11 @@ def duration_mass(text_block, fixation_sequence, *, ngram_width=1, gamma=30):
     of all fixations. This can be passed to `eyekit.vis.Image.draw_heatmap()`
     for visualization. Duration mass reveals the parts of the text that
     received the most attention. Optionally, this can be performed over
-    higher-level ngrams by setting `ngram_width` > 1.
+    higher-level ngrams by setting `ngram_width` > 1. If any fixation
+    receives no probability mass on its line, because the line is too short
+    to contain an ngram of that width or because the fixation is so far away
+    that every probability underflows to zero, the distribution is undefined
+    and every cell is NaN.
     """
     try:
         import numpy as np
@@ -366,25 +386,53 @@ def duration_mass(text_block, fixation_sequence, *, ngram_width=1, gamma=30):
     _is_TextBlock(text_block)
     _is_FixationSequence(fixation_sequence)
     shape = text_block.n_rows, text_block.n_cols - (ngram_width - 1)
-    two_gamma_squared = 2 * gamma**2
-
-    def p_characters_fixation(fixation):
-        line_n = np.argmin(abs(np.array(text_block.midlines) - fixation.y))
-        p_distribution = np.zeros(shape, dtype=float)
-        fixation_xy = np.array(fixation.xy, dtype=int)
+    neg_inv_two_gamma_squared = -1 / (2 * gamma**2)
+
+    fixation_XYD = np.array(
+        [
+            (fixation.x, fixation.y, fixation.duration)
+            for fixation in fixation_sequence.iter_without_discards()
+        ],
+        dtype=int,
+    ).reshape(-1, 3)
+    # Midlines increase down the page, so the nearest line is found by
+    # locating each fixation among the points halfway between midlines
+    midlines = np.array(text_block.midlines)
+    line_indices = np.searchsorted(
+        (midlines[:-1] + midlines[1:]) / 2, fixation_XYD[:, 1], side="left"
+    )
+    distribution = np.zeros(shape, dtype=float)
+    for line_n in np.unique(line_indices):
+        ngram_boxes, ngram_indices = [], []
         for ngram in text_block.ngrams(
             ngram_width, line_n=line_n, alphabetical_only=False
         ):
-            ngram_xy = np.array(ngram.center, dtype=int)
             r, s, _ = ngram.location
-            p_distribution[(r, s)] = np.exp(
-                -((fixation_xy - ngram_xy) ** 2).sum() / two_gamma_squared
-            )
-        return p_distribution / p_distribution.sum()
-
-    distribution = np.zeros(shape, dtype=float)
-    for fixation in fixation_sequence.iter_without_discards():
-        distribution += p_characters_fixation(fixation) * fixation.duration
+            ngram_boxes.append((ngram.x_tl, ngram.y_tl, ngram.x_br, ngram.y_br))
+            ngram_indices.append(r * shape[1] + s)
+        # Centers computed from the corners in one go, as in Box.center
+        ngram_boxes = np.array(ngram_boxes, dtype=float).reshape(-1, 4)
+        ngram_xy = ngram_boxes[:, :2] + (ngram_boxes[:, 2:] - ngram_boxes[:, :2]) / 2
+        ngram_xy = ngram_xy.astype(int)
+        line_XYD = fixation_XYD[line_indices == line_n]
+        # p(c|f) for every fixation on the line (rows) and ngram (columns),
+        # from the squared distances, reusing the two difference buffers
+        diff_X = line_XYD[:, 0, None] - ngram_xy[None, :, 0]
+        diff_Y = line_XYD[:, 1, None] - ngram_xy[None, :, 1]
+        diff_X *= diff_X
+        diff_Y *= diff_Y
+        diff_X += diff_Y
+        p_characters_fixations = np.multiply(diff_X, neg_inv_two_gamma_squared)
+        np.exp(p_characters_fixations, out=p_characters_fixations)
+        p_totals = p_characters_fixations.sum(axis=1, keepdims=True)
+        if not p_totals.all():
+            # A fixation has no weight on its line (the line holds no ngrams
+            # of this width, or every weight underflows), so p(c|f) is 0/0
+            # and, as with the per-fixation calculation, the whole
+            # distribution is undefined
+            return np.full(shape, np.nan)
+        p_characters_fixations /= p_totals
+        distribution.flat[ngram_indices] += line_XYD[:, 2] @ p_characters_fixations
     return distribution
 
 
@@ -241,9 +241,12 @@ class Image:
                     },
                 )
         if callable(color):
-            color_func = color
+            color_func = lambda fxn: _color_to_rgb(color(fxn), default=(0, 0, 0))
         else:
-            color_func = lambda fxn: discard_color if fxn.discarded else color
+            # Only two colors are possible, so convert them once up front
+            rgb_color = _color_to_rgb(color, default=(0, 0, 0))
+            rgb_discard_color = _color_to_rgb(discard_color, default=(0, 0, 0))
+            color_func = lambda fxn: rgb_discard_color if fxn.discarded else rgb_color
         if fixation_radius is None:
             radius_func = lambda fxn: (fxn.duration / 3.141592653589793) ** 0.5
         elif callable(fixation_radius):
@@ -251,18 +254,16 @@ class Image:
         else:
             radius_func = lambda fxn: fixation_radius
         for fixation in seq_iterator():
-            radius = radius_func(fixation)
-            rgb_color = _color_to_rgb(color_func(fixation), default=(0, 0, 0))
             self._add_component(
                 _draw_circle,
                 {
                     "x": fixation.x,
                     "y": fixation.y,
-                    "radius": radius,
+                    "radius": radius_func(fixation),
                     "color": None,
                     "stroke_width": None,
                     "dashed": False,
-                    "fill_color": rgb_color,
+                    "fill_color": color_func(fixation),
                     "opacity": opacity,
                 },
             )
@@ -294,12 +295,14 @@ class Image:
         _is_TextBlock(text_block)
         rgb_color = _color_to_rgb(color, default=(1, 0, 0))
         ngram_width = (text_block.n_cols - distribution.shape[1]) + 1
-        distribution = distribution / distribution.max()
+        # Normalize and convert to nested lists once, so that the per-ngram
+        # lookups below are plain list indexing on Python floats
+        distribution = (distribution / distribution.max()).tolist()
         subcell_height = text_block.line_height / ngram_width
         level = 0
         for ngram in text_block.ngrams(ngram_width, alphabetical_only=False):
             r, s, _ = ngram.location
-            cell_color = _pseudo_alpha(rgb_color, distribution[r, s])
+            cell_color = _pseudo_alpha(rgb_color, distribution[r][s])
             self._add_component(
                 _draw_rectangle,
                 {
@@ -1244,8 +1247,8 @@ def _strip_cairo_surface_id_from_SVG(output_path):
     Cairo's SVG output includes a random ID number in the global <g> tag.
     Remove this ID to produce deterministic SVG output.
     """
-    with open(output_path, "r") as file:
+    with open(output_path, "rb") as file:
         file_content = file.read()
-    file_content = _re.sub(r'<g id="surface.+?">', "<g>", file_content)
-    with open(output_path, "w") as file:
+    file_content = _re.sub(rb'<g id="surface.+?">', b"<g>", file_content)
+    with open(output_path, "wb") as file:
         file.write(file_content)
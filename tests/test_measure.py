@@ -1,3 +1,4 @@
+import math
 import eyekit
 
 sentence = "The quick brown fox [jump]{stem_1}[ed]{suffix_1} over the lazy dog."
@@ -372,3 +373,21 @@ def test_second_pass_duration():
         ]
     )
     assert eyekit.measure.second_pass_duration(txt["ia"], seq) == 50
+
+
+def test_duration_mass():
+    distribution = eyekit.measure.duration_mass(txt, seq)
+    assert distribution.shape == (1, txt.n_cols)
+    assert round(distribution.sum()) == 1300
+
+    txt_short = eyekit.TextBlock(
+        ["The quick brown fox", "Hi"], position=(100, 500), font_size=36
+    )
+    seq_short = eyekit.FixationSequence([[106, 490, 0, 200], [110, 550, 200, 400]])
+    distribution = eyekit.measure.duration_mass(txt_short, seq_short, ngram_width=3)
+    assert distribution.shape == (2, 17)
+    assert all(math.isnan(value) for value in distribution.flat)
+
+    seq_far = eyekit.FixationSequence([[106, 490, 0, 200], [3000, 550, 200, 400]])
+    distribution = eyekit.measure.duration_mass(txt_short, seq_far)
+    assert all(math.isnan(value) for value in distribution.flat)